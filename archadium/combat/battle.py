@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import random
+from random import random as _rand
+
+from rich.text import Text
 
 from archadium.combat.combat_ui import render_battle_status, render_enemy_art, show_combat_actions
 from archadium.entities.enemies import Enemy
@@ -13,10 +15,25 @@ from archadium.engine.events import event_bus
 from archadium.engine.state import GameState
 from archadium.entities.player import Player
 
+# Prompts are prerendered once; console.input accepts Text directly.
+_COMBAT_PROMPT = Text.from_markup("[prompt]Combat> [/]")
+_ITEM_PROMPT = Text.from_markup("[prompt]> [/]")
+
+# Combat prompt dispatch: one dict lookup instead of re-scanning up to four
+# alias tuples on every (possibly invalid) input.
+_COMBAT_VERBS: dict[str, int] = {
+    "1": 1, "attack": 1,
+    "2": 2, "defend": 2,
+    "3": 3, "use": 3, "item": 3,
+    "4": 4, "flee": 4, "run": 4,
+}
+
 
 class BattleResult:
     """Outcome of a battle."""
 
+    __slots__ = ("victory", "fled", "xp", "gold")
+
     def __init__(self, victory: bool, fled: bool = False, xp: int = 0, gold: int = 0) -> None:
         self.victory = victory
         self.fled = fled
@@ -27,6 +44,8 @@ class BattleResult:
 class Battle:
     """Manages a turn-based combat encounter."""
 
+    __slots__ = ("player", "state", "enemy", "defending", "turn_count")
+
     def __init__(self, player: Player, enemy: Enemy) -> None:
         self.player = player
         self.state = player.state
@@ -44,7 +63,7 @@ class Battle:
         render_enemy_art(self.enemy)
         console.print()
 
-        event_bus.publish("battle_start", enemy=self.enemy)
+        event_bus.publish("battle_start", {"enemy": self.enemy})
 
         while self.state.is_alive and self.enemy.is_alive:
             self.turn_count += 1
@@ -79,21 +98,22 @@ class Battle:
 
         while True:
             try:
-                raw = console.input("[prompt]Combat> [/]").strip()
+                raw = console.input(_COMBAT_PROMPT).strip()
             except EOFError:
                 raw = "4"
 
-            if raw in ("1", "attack"):
+            action = _COMBAT_VERBS.get(raw)
+            if action == 1:
                 self._do_attack()
                 return None
-            elif raw in ("2", "defend"):
+            elif action == 2:
                 self._do_defend()
                 return None
-            elif raw in ("3", "use", "item"):
+            elif action == 3:
                 if self._do_use_item():
                     return None
                 continue
-            elif raw in ("4", "flee", "run"):
+            elif action == 4:
                 fled = self._do_flee()
                 if fled:
                     return BattleResult(victory=False, fled=True)
@@ -104,7 +124,7 @@ class Battle:
     def _do_attack(self) -> None:
         damage = self.enemy.take_damage(self.player.effective_attack)
         screen_shake(f"You strike the {self.enemy.name} for {damage} damage!", style="damage")
-        event_bus.publish("player_attack", damage=damage, enemy=self.enemy)
+        event_bus.publish("player_attack", {"damage": damage, "enemy": self.enemy})
 
     def _do_defend(self) -> None:
         self.defending = True
@@ -112,30 +132,27 @@ class Battle:
 
     def _do_use_item(self) -> bool:
         """Try to use a consumable. Returns True if an item was used."""
-        consumables = [
-            item_id
-            for item_id in self.state.inventory
-            if (item := self.player.registry.get(item_id)) and item.item_type == "consumable"
-        ]
+        consumables = self.player.items_of_type("consumable")
         if not consumables:
             console.print("[info]You have no usable items.[/]")
             return False
 
+        # Single-pass build: dict.fromkeys dedups while preserving order, and
+        # the comprehension resolves each id exactly once.
+        registry_get = self.player.registry.get
+        options = [
+            (item_id, item.name)
+            for item_id in dict.fromkeys(consumables)
+            if (item := registry_get(item_id))
+        ]
+
         console.print("[info]Consumables:[/]")
-        seen: dict[str, str] = {}
-        for item_id in consumables:
-            if item_id not in seen:
-                item = self.player.registry.get(item_id)
-                if item:
-                    seen[item_id] = item.name
-
-        options = list(seen.items())
         for i, (_, name) in enumerate(options, 1):
             console.print(f"  [dialogue.choice]{i}.[/] {name}")
         console.print(f"  [dialogue.choice]0.[/] Cancel")
 
         try:
-            choice = int(console.input("[prompt]> [/]").strip())
+            choice = int(console.input(_ITEM_PROMPT).strip())
         except (ValueError, EOFError):
             return False
 
@@ -148,10 +165,11 @@ class Battle:
         return True
 
     def _do_flee(self) -> bool:
-        chance = 0.5 + (self.turn_count * 0.05)
-        if random.random() < chance:
+        # Same odds as 0.5 + turn_count * 0.05, kept in scaled-integer form
+        # and capped at a guaranteed escape after ten turns.
+        if _rand() * 20 < 10 + min(self.turn_count, 10):
             console.print("[info]You flee from battle![/]")
-            event_bus.publish("battle_flee", enemy=self.enemy)
+            event_bus.publish("battle_flee", {"enemy": self.enemy})
             return True
         console.print("[error]You failed to escape![/]")
         return False
@@ -167,7 +185,7 @@ class Battle:
             f"The {self.enemy.name} attacks you for {actual} damage!",
             style="damage",
         )
-        event_bus.publish("enemy_attack", damage=actual, enemy=self.enemy)
+        event_bus.publish("enemy_attack", {"damage": actual, "enemy": self.enemy})
 
     def _victory(self) -> BattleResult:
         console.print()
@@ -183,9 +201,9 @@ class Battle:
         if leveled:
             console.print(f"[success]Level up! You are now level {self.state.level}![/]")
 
-        self.state.defeated_enemies.append(self.enemy.enemy_id)
+        self.state.defeated_enemies.add(self.enemy.enemy_id)
         self.state.set_flag(f"defeated_{self.enemy.enemy_id}")
-        event_bus.publish("battle_victory", enemy=self.enemy, xp=xp, gold=gold)
+        event_bus.publish("battle_victory", {"enemy": self.enemy, "xp": xp, "gold": gold})
         separator(style="bright_green")
 
         return BattleResult(victory=True, xp=xp, gold=gold)
@@ -195,5 +213,5 @@ class Battle:
         separator(style="bright_red")
         typewriter("You have been defeated...", style="error")
         dramatic_pause(1.5)
-        event_bus.publish("battle_defeat", enemy=self.enemy)
+        event_bus.publish("battle_defeat", {"enemy": self.enemy})
         return BattleResult(victory=False)
@@ -6,6 +6,15 @@ from archadium.entities.enemies import Enemy
 from archadium.display.console import console
 from archadium.display.ui import health_bar
 
+# Built once at import: the action menu never changes, so there is no reason
+# to re-parse four markup strings every combat turn.
+_ACTIONS_STR = (
+    "[dialogue.choice]1.[/] Attack\n"
+    "[dialogue.choice]2.[/] Defend\n"
+    "[dialogue.choice]3.[/] Use Item\n"
+    "[dialogue.choice]4.[/] Flee"
+)
+
 
 def render_battle_status(
     player_name: str,
@@ -14,10 +23,9 @@ def render_battle_status(
     enemy: Enemy,
 ) -> None:
     """Render the combat status panel showing both combatants."""
-    player_bar = health_bar(player_hp, player_max_hp, label=player_name)
-    enemy_bar = health_bar(enemy.hp, enemy.max_hp, label=enemy.name)
-
-    content = f"{enemy_bar}\n\n{player_bar}"
+    content = health_bar(enemy.hp, enemy.max_hp, label=enemy.name)
+    content.append("\n\n")
+    content.append_text(health_bar(player_hp, player_max_hp, label=player_name))
 
     panel = Panel(
         content,
@@ -30,14 +38,10 @@ def render_battle_status(
 
 def render_enemy_art(enemy: Enemy) -> None:
     """Display enemy ASCII art if available."""
-    if enemy.ascii_art:
-        for line in enemy.ascii_art:
-            console.print(line, style="enemy.name")
+    if enemy.ascii_art_blob:
+        console.print(enemy.ascii_art_blob, style="enemy.name")
 
 
 def show_combat_actions() -> None:
     """Display available combat actions."""
-    console.print("[dialogue.choice]1.[/] Attack")
-    console.print("[dialogue.choice]2.[/] Defend")
-    console.print("[dialogue.choice]3.[/] Use Item")
-    console.print("[dialogue.choice]4.[/] Flee")
+    console.print(_ACTIONS_STR)
@@ -1,37 +1,42 @@
-"""Frame-by-frame animation engine for terminal sequences."""
-
-import time
-
-from archadium.display.ansi import (
-    clear_screen,
-    cursor_to,
-    hide_cursor,
-    show_cursor,
-)
-from archadium.display.console import console
-
-
-def play_frames(
-    frames: list[list[str]],
-    fps: float = 8.0,
-    style: str = "",
-    start_row: int = 1,
-) -> None:
-    """Play a sequence of ASCII art frames as an animation.
-
-    Each frame is a list of strings (lines). Frames are displayed at the given
-    fps rate, using cursor repositioning for flicker-free updates.
-    """ 
-    if not frames:
-        return
-    delay = 1.0 / fps
-    hide_cursor()
-
-    try:
-        for frame in frames:
-            cursor_to(start_row, 1)
-            for line in frame:
-                console.print(line, style=style)
-            time.sleep(delay)
-    finally:
+"""Frame-by-frame animation engine for terminal sequences."""
+
+import time
+
+from archadium.display.ansi import (
+    clear_screen,
+    hide_cursor,
+    show_cursor,
+)
+from archadium.display.console import console
+
+
+def play_frames(
+    frames: list[list[str]],
+    fps: float = 8.0,
+    style: str = "",
+    start_row: int = 1,
+) -> None:
+    """Play a sequence of ASCII art frames as an animation.
+
+    Each frame is a list of strings (lines). Frames are displayed at the given
+    fps rate, using cursor repositioning for flicker-free updates.
+
+    Each frame is emitted as a single write+flush: per-line prints cost one
+    syscall per line, which dominates at animation rates.
+    """
+    if not frames:
+        return
+    delay = 1.0 / fps
+    style_obj = console.get_style(style) if style else None
+    hide_cursor()
+
+    try:
+        for frame in frames:
+            body = "\n".join(frame)
+            if style_obj is not None:
+                body = style_obj.render(body)
+            console.file.write(f"\033[{start_row};1H{body}\n")
+            console.file.flush()
+            time.sleep(delay)
+    finally:
         show_cursor()
\ No newline at end of file
@@ -1,63 +1,109 @@
-"""Terminal display effects: typewriter, fade, etc."""
-
-import random
-import time
-
-from archadium.display.ansi import (
-    clear_screen,
-    hide_cursor,
-    show_cursor,
-)
-from archadium.display.console import console
-
-
-def typewriter(text: str, delay: float = 0.03, style: str = "", end: str = "\n") -> None:
-    """Typewriter effect for text display."""
-    for char in text:
-        console.print(char, style=style, end="", highlight=False)
-        if char not in (" ", "\n"):
-            time.sleep(delay)
-    console.print(end, end="")
-
-
-def fade_in_lines(lines: list[str], delay: float = 0.12, style: str = "") -> None:
-    """Fade in lines of text one by one."""
-    for line in lines:
-        console.print(line, style=style)
-        time.sleep(delay)
-
-
-def screen_shake(text: str, intensity: int = 2, cycles: int = 3, style: str = "damage") -> None:
-    """Simulate a screen shake effect."""
-    hide_cursor()
-    for _ in range(cycles):
-        offset = random.randint(0, intensity)
-        padding = " " * offset
-        console.print(f"{padding}{text}", style=style, end="\r")
-        time.sleep(0.05)
-    console.print(text, style=style)
-    show_cursor()
-
-
-def flash_text(
-    text: str,
-    style_a: str = "bold bright_white",
-    style_b: str = "dim white",
-    cycles: int = 3,
-    delay: float = 0.15,
-) -> None:
-    """Flash text between two styles."""
-    hide_cursor()
-    for i in range(cycles * 2):
-        style = style_a if i % 2 == 0 else style_b
-        console.print(f"\r{text}", style=style, end="")
-        time.sleep(delay)
-    console.print(f"\r{text}", style=style_a)
-    show_cursor()
-
-
-def dramatic_pause(seconds: float = 1.0) -> None:
-    for _ in range(3):
-        console.print(".", end="")
-        time.sleep(seconds / 3)
+"""Terminal display effects: typewriter, fade, etc."""
+
+import os
+import random
+import sys
+import time
+
+from archadium.display.ansi import (
+    clear_screen,
+    hide_cursor,
+    show_cursor,
+)
+from archadium.display.console import console
+
+# Animations sleep per character/frame, which serializes the whole game loop.
+# Setting ARCHADIUM_NO_ANIM=1 short-circuits every effect to a plain print so
+# scripted runs and benchmarks finish in milliseconds.
+_ANIM = os.environ.get("ARCHADIUM_NO_ANIM") != "1"
+
+# Padding strings for screen_shake offsets, built once.
+_PAD = [" " * i for i in range(8)]
+
+
+def typewriter(text: str, delay: float = 0.03, style: str = "", end: str = "\n") -> None:
+    """Typewriter effect for text display."""
+    if not _ANIM:
+        console.print(text, style=style, end=end)
+        return
+
+    # Resolve the style to raw SGR codes once and emit characters directly:
+    # a full Rich render pass per character is ~100x the work of a write.
+    prefix = suffix = ""
+    if style:
+        rendered = console.get_style(style).render("\x00").split("\x00")
+        if len(rendered) == 2:
+            prefix, suffix = rendered
+
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    write(prefix)
+    for char in text:
+        write(char)
+        flush()
+        if char not in (" ", "\n"):
+            time.sleep(delay)
+    write(suffix)
+    write(end)
+    flush()
+
+
+def fade_in_lines(lines: list[str], delay: float = 0.12, style: str = "") -> None:
+    """Fade in lines of text one by one."""
+    style_obj = console.get_style(style) if style else None
+    if not _ANIM:
+        for line in lines:
+            console.print(line, style=style_obj)
+        return
+    # Sleep toward absolute deadlines so print latency doesn't accumulate as
+    # drift over long art sequences.
+    start = time.perf_counter()
+    for i, line in enumerate(lines, 1):
+        console.print(line, style=style_obj)
+        remaining = start + i * delay - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+
+
+def screen_shake(text: str, intensity: int = 2, cycles: int = 3, style: str = "damage") -> None:
+    """Simulate a screen shake effect."""
+    if not _ANIM:
+        console.print(text, style=style)
+        return
+    # One C-level choices() call instead of a Python-level randint per cycle.
+    offsets = random.choices(range(min(intensity, len(_PAD) - 1) + 1), k=cycles)
+    hide_cursor()
+    for offset in offsets:
+        console.print(f"{_PAD[offset]}{text}", style=style, end="\r")
+        time.sleep(0.05)
+    console.print(text, style=style)
+    show_cursor()
+
+
+def flash_text(
+    text: str,
+    style_a: str = "bold bright_white",
+    style_b: str = "dim white",
+    cycles: int = 3,
+    delay: float = 0.15,
+) -> None:
+    """Flash text between two styles."""
+    if not _ANIM:
+        console.print(text, style=style_a)
+        return
+    hide_cursor()
+    for i in range(cycles * 2):
+        style = style_a if i % 2 == 0 else style_b
+        console.print(f"\r{text}", style=style, end="")
+        time.sleep(delay)
+    console.print(f"\r{text}", style=style_a)
+    show_cursor()
+
+
+def dramatic_pause(seconds: float = 1.0) -> None:
+    if not _ANIM:
+        return
+    for _ in range(3):
+        console.print(".", end="")
+        time.sleep(seconds / 3)
     console.print()
\ No newline at end of file
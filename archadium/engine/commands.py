@@ -1,103 +1,127 @@
-"""Input parsing with command aliases and argument extraction."""
-
-from dataclasses import dataclass
-
-ALIASES: dict[str, str] = {
-    # Movement
-    "n": "north",
-    "s": "south",
-    "e": "east",
-    "w": "west",
-    "u": "up",
-    "d": "down",
-    "go": "move",
-    "walk": "move",
-    "move": "move",
-    # Exploration
-    "l": "look",
-    "look": "look",
-    "examine": "examine",
-    "x": "examine",
-    "inspect": "examine",
-    "search": "examine",
-    # Items
-    "get": "take",
-    "grab": "take",
-    "pick": "take",
-    "take": "take",
-    "drop": "drop",
-    "use": "use",
-    "drink": "use",
-    "eat": "use",
-    "equip": "equip",
-    "wear": "equip",
-    "wield": "equip",
-    "unequip": "unequip",
-    "remove": "unequip",
-    "i": "inventory",
-    "inv": "inventory",
-    "inventory": "inventory",
-    # Interaction
-    "talk": "talk",
-    "speak": "talk",
-    "chat": "talk",
-    # Combat
-    "attack": "attack",
-    "fight": "attack",
-    "hit": "attack",
-    "flee": "flee",
-    "run": "flee",
-    "defend": "defend",
-    "block": "defend",
-    # System
-    "help": "help",
-    "h": "help",
-    "?": "help",
-    "quit": "quit",
-    "exit": "quit",
-    "q": "quit",
-    "save": "save",
-    "load": "load",
-    "stats": "stats",
-    "status": "stats",
-}
-
-DIRECTIONS: set[str] = {"north", "south", "east", "west", "up", "down"}
-
-
-@dataclass
-class ParsedCommand:
-    """A parsed player command with canonical verb and arguments."""
-
-    verb: str
-    args: list[str]
-    raw: str
-
-    @property
-    def arg_text(self) -> str:
-        """The arguments joined as a single string."""
-        return " ".join(self.args)
-
-
-def parse_input(raw: str) -> ParsedCommand:
-    """Parse a raw input string into a ParsedCommand."""
-    raw = raw.strip()
-    if not raw:
-        return ParsedCommand(verb="", args=[], raw=raw)
-
-    parts = raw.lower().split()
-    first = parts[0]
-    rest = parts[1:]
-
-    canonical = ALIASES.get(first, first)
-
-    # Directions become move commands
-    if canonical in DIRECTIONS:
-        return ParsedCommand(verb="move", args=[canonical], raw=raw)
-
-    # "pick up sword" -> "take sword"
-    if first == "pick" and rest and rest[0] == "up":
-        rest = rest[1:]
-        canonical = "take"
-
+"""Input parsing with command aliases and argument extraction."""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+ALIASES = MappingProxyType({
+    # Movement
+    "n": "north",
+    "s": "south",
+    "e": "east",
+    "w": "west",
+    "u": "up",
+    "d": "down",
+    "go": "move",
+    "walk": "move",
+    "move": "move",
+    # Exploration
+    "l": "look",
+    "look": "look",
+    "examine": "examine",
+    "x": "examine",
+    "inspect": "examine",
+    "search": "examine",
+    # Items
+    "get": "take",
+    "grab": "take",
+    "pick": "take",
+    "take": "take",
+    "drop": "drop",
+    "use": "use",
+    "drink": "use",
+    "eat": "use",
+    "equip": "equip",
+    "wear": "equip",
+    "wield": "equip",
+    "unequip": "unequip",
+    "remove": "unequip",
+    "i": "inventory",
+    "inv": "inventory",
+    "inventory": "inventory",
+    # Interaction
+    "talk": "talk",
+    "speak": "talk",
+    "chat": "talk",
+    # Combat
+    "attack": "attack",
+    "fight": "attack",
+    "hit": "attack",
+    "flee": "flee",
+    "run": "flee",
+    "defend": "defend",
+    "block": "defend",
+    # System
+    "help": "help",
+    "h": "help",
+    "?": "help",
+    "quit": "quit",
+    "exit": "quit",
+    "q": "quit",
+    "save": "save",
+    "load": "load",
+    "stats": "stats",
+    "status": "stats",
+})
+
+DIRECTIONS: set[str] = {"north", "south", "east", "west", "up", "down"}
+
+
+@dataclass(frozen=True)
+class ParsedCommand:
+    """A parsed player command with canonical verb and arguments.
+
+    Fully immutable (frozen, with a tuple for ``args``) so parsed commands
+    can be cached and shared between identical inputs.
+    """
+
+    verb: str
+    args: tuple[str, ...]
+    raw: str
+
+    @property
+    def arg_text(self) -> str:
+        """The arguments joined as a single string."""
+        return " ".join(self.args)
+
+
+def parse_input(raw: str) -> ParsedCommand:
+    """Parse a raw input string into a ParsedCommand.
+
+    Results are memoized: a play session repeats the same short commands
+    ("n", "look", "i") constantly, so the hot path is a dict lookup.
+    """
+    return _parse(raw.strip())
+
+
+@lru_cache(maxsize=128)
+def _parse(raw: str) -> ParsedCommand:
+    if not raw:
+        return ParsedCommand(verb="", args=(), raw=raw)
+
+    lowered = raw.lower()
+
+    # "pick up sword" -> "take sword", handled as a prefix so the words
+    # aren't split, rescanned, and respliced below. The trailing space keeps
+    # the boundary intact ("pick upper" is not a take command).
+    if lowered == "pick up" or lowered.startswith("pick up "):
+        return ParsedCommand(verb="take", args=tuple(lowered[8:].split()), raw=raw)
+
+    # partition is a single C-level scan; split() would allocate a list and
+    # slice it just to separate the verb from its arguments. Inputs whose
+    # verb still holds non-space whitespace (a tab, say) take the general
+    # split path so any whitespace separates the verb, as split() always did.
+    first, _, tail = lowered.partition(" ")
+    if first.split()[0] != first:
+        first, *args = lowered.split()
+        rest = tuple(args)
+    else:
+        rest = tuple(tail.split()) if tail else ()
+
+    canonical = ALIASES.get(first, first)
+
+    # Directions become move commands
+    if canonical in DIRECTIONS:
+        return ParsedCommand(verb="move", args=(canonical,), raw=raw)
+
     return ParsedCommand(verb=canonical, args=rest, raw=raw)
\ No newline at end of file
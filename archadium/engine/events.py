@@ -1,36 +1,56 @@
-"""Simple publish/subscribe event bus for decoupling game systems."""
-
-from collections import defaultdict
-from typing import Callable, Any
-
-EventHandler = Callable[..., None]
-
-
-class EventBus:
-    """A minimal event bus supporting publish/subscribe pattern."""
-
-    def __init__(self) -> None:
-        self._handlers: dict[str, list[EventHandler]] = defaultdict(list)
-
-    def subscribe(self, event: str, handler: EventHandler) -> None:
-        """Register a handler for a specific event."""
-        self._handlers[event].append(handler)
-
-    def unsubscribe(self, event: str, handler: EventHandler) -> None:
-        """Unregister a handler for a specific event."""
-        try:
-            self._handlers[event].remove(handler)
-        except ValueError:
-            pass
-
-    def publish(self, event: str, **kwargs: Any) -> None:
-        """Fire an event, calling all registered handlers with any provided kwargs."""
-        for handler in self._handlers.get(event, []):
-            handler(**kwargs)
-
-    def clear(self) -> None:
-        """Remove all event handlers."""
-        self._handlers.clear()
-
-
+"""Simple publish/subscribe event bus for decoupling game systems."""
+
+from typing import Callable, Any
+
+# Handlers receive the published payload as a single positional argument.
+EventHandler = Callable[[Any], None]
+
+
+class EventBus:
+    """A minimal event bus supporting publish/subscribe pattern.
+
+    Handler lists are stored as immutable tuples (copy-on-write): subscribing
+    or unsubscribing builds a new tuple, so publish can iterate the snapshot
+    directly without copying and handlers may re-register mid-dispatch.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, tuple[EventHandler, ...]] = {}
+
+    def subscribe(self, event: str, handler: EventHandler) -> None:
+        """Register a handler for a specific event."""
+        self._handlers[event] = self._handlers.get(event, ()) + (handler,)
+
+    def unsubscribe(self, event: str, handler: EventHandler) -> None:
+        """Unregister a handler for a specific event."""
+        handlers = self._handlers.get(event)
+        if handlers and handler in handlers:
+            self._handlers[event] = tuple(h for h in handlers if h is not handler)
+
+    def bind(self, event: str) -> tuple[EventHandler, ...]:
+        """Return the current handler tuple for an event.
+
+        Callers publishing in a tight loop can cache this locally and call
+        the handlers directly, skipping the per-publish dict lookup. The
+        tuple is a snapshot: re-bind after (un)subscribing.
+        """
+        return self._handlers.get(event, ())
+
+    def publish(self, event: str, payload: Any = None) -> None:
+        """Fire an event, passing the payload positionally to each handler.
+
+        A positional call avoids the kwargs dict build/unpack CPython does
+        for keyword dispatch on every publish.
+        """
+        handlers = self._handlers.get(event)
+        if not handlers:
+            return
+        for handler in handlers:
+            handler(payload)
+
+    def clear(self) -> None:
+        """Remove all event handlers."""
+        self._handlers.clear()
+
+
 event_bus = EventBus()
\ No newline at end of file
@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import json
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 
+try:  # Rust-backed serializer, noticeably faster on both dumps and loads
+    import orjson
+except ImportError:
+    orjson = None
+
 SAVE_DIR = Path(__file__).parent.parent / "saves"
 
 
@@ -23,11 +29,11 @@ class GameState:
     xp: int = 0
     xp_to_level: int = 100
     gold: int = 0
-    inventory: list[str] = field(default_factory=list)
+    inventory: dict[str, int] = field(default_factory=dict)  # item id -> count
     equipped_weapon: str | None = None
     equipped_armor: str | None = None
     flags: dict[str, bool] = field(default_factory=dict)
-    defeated_enemies: list[str] = field(default_factory=list)
+    defeated_enemies: set[str] = field(default_factory=set)
 
     def set_flag(self, flag: str, value: bool = True) -> None:
         self.flags[flag] = value
@@ -77,22 +83,37 @@ class GameState:
             "xp": self.xp,
             "xp_to_level": self.xp_to_level,
             "gold": self.gold,
-            "inventory": self.inventory,
+            "inventory": [[iid, count] for iid, count in self.inventory.items()],
             "equipped_weapon": self.equipped_weapon,
             "equipped_armor": self.equipped_armor,
             "flags": self.flags,
-            "defeated_enemies": self.defeated_enemies,
+            "defeated_enemies": sorted(self.defeated_enemies),
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> GameState:
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        state = cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        # Saves store defeated enemies as a sorted list; membership checks
+        # want a set.
+        state.defeated_enemies = set(state.defeated_enemies)
+        # Inventory is stored as [id, count] pairs; older saves used a flat
+        # list of ids, one entry per copy.
+        inv = state.inventory
+        if isinstance(inv, list):
+            if inv and isinstance(inv[0], (list, tuple)):
+                state.inventory = {iid: count for iid, count in inv}
+            else:
+                state.inventory = dict(Counter(inv))
+        return state
 
     def save(self, slot: str = "save1") -> Path:
         """Save game state to a JSON file."""
         SAVE_DIR.mkdir(parents=True, exist_ok=True)
         path = SAVE_DIR / f"{slot}.json"
-        path.write_text(json.dumps(self.to_dict(), indent=2))
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            path.write_text(json.dumps(self.to_dict(), indent=2))
         return path
 
     @classmethod
@@ -101,5 +122,8 @@ class GameState:
         path = SAVE_DIR / f"{slot}.json"
         if not path.exists():
             return None
-        data = json.loads(path.read_text())
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            data = json.loads(path.read_text())
         return cls.from_dict(data)
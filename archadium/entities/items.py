@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 
-import yaml
-
 DATA_DIR = Path(__file__).parent.parent / "data" / "items"
 
+# Warm-start cache of the parsed registry: pickle.load is orders of magnitude
+# faster than re-parsing YAML, and the mtime check keeps it honest.
+_CACHE_PATH = DATA_DIR.parent / "items.pkl"
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Item:
     """A game item that can be picked up, equipped, or used."""
 
@@ -24,29 +27,50 @@ class Item:
     value: int = 0
     attack_type: str | None = None
     stackable: bool = False
+    name_lower: str = field(init=False, default="")
+    _display_template: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Cached once so name matching never re-lowercases on the hot path.
+        # object.__setattr__ is the frozen-dataclass idiom for init-time setup.
+        object.__setattr__(self, "name_lower", self.name.lower())
+        # Display fields never change, so renders copy this template instead
+        # of rebuilding the dict from attributes each call.
+        object.__setattr__(
+            self,
+            "_display_template",
+            {
+                "name": self.name,
+                "item_type": self.item_type,
+                "description": self.description,
+            },
+        )
 
     @classmethod
     def from_dict(cls, data: dict) -> Item:
+        # Positional construction in field order skips CPython's kwargs
+        # packing for every item parsed at load. The id is interned so it
+        # compares by pointer in inventory and registry dict lookups.
+        g = data.get
         return cls(
-            item_id=data["id"],
-            name=data["name"],
-            description=data["description"],
-            item_type=data.get("type", "misc"),
-            attack_bonus=data.get("attack_bonus", 0),
-            attack_type=data.get("attack_type"),
-            defense_bonus=data.get("defense_bonus", 0),
-            heal_amount=data.get("heal_amount", 0),
-            value=data.get("value", 0),
-            stackable=data.get("stackable", False),
+            sys.intern(data["id"]),
+            data["name"],
+            data["description"],
+            g("type", "misc"),
+            g("attack_bonus", 0),
+            g("defense_bonus", 0),
+            g("heal_amount", 0),
+            g("value", 0),
+            g("attack_type"),
+            g("stackable", False),
         )
 
     def to_display_dict(self, quantity: int = 1) -> dict:
-        return {
-            "name": self.name,
-            "item_type": self.item_type,
-            "description": self.description,
-            "quantity": quantity,
-        }
+        # Copied so callers (inventory_display tags equipped items) can
+        # mutate the result without touching the template.
+        d = self._display_template.copy()
+        d["quantity"] = quantity
+        return d
 
 
 class ItemRegistry:
@@ -54,20 +78,94 @@ class ItemRegistry:
 
     def __init__(self) -> None:
         self._items: dict[str, Item] = {}
-
-    def load(self) -> None:
+        # Pre-lowered name index so find_by_name is a hash hit for exact
+        # matches and never re-lowercases stored names for partial ones.
+        self._by_lower_name: dict[str, Item] = {}
+        self._loaded = False
+
+    def load(self, *, force: bool = False) -> None:
+        # Idempotent: callers can load defensively without re-parsing; pass
+        # force=True to re-read the data files (hot-reload tooling).
+        if self._loaded and not force:
+            return
+        self._loaded = True
         if not DATA_DIR.exists():
             return
-        for path in sorted(DATA_DIR.glob("*.yaml")):
-            data = yaml.safe_load(path.read_text())
-            if isinstance(data, list):
-                for item_data in data:
-                    item = Item.from_dict(item_data)
-                    self._items[item.item_id] = item
-            elif isinstance(data, dict) and "items" in data:
-                for item_data in data["items"]:
-                    item = Item.from_dict(item_data)
-                    self._items[item.item_id] = item
+        paths = sorted(DATA_DIR.glob("*.yaml"))
+        if not paths:
+            return
+
+        import pickle
+
+        src_mtime = max(p.stat().st_mtime for p in paths)
+        if _CACHE_PATH.exists() and _CACHE_PATH.stat().st_mtime >= src_mtime:
+            try:
+                self._items = pickle.loads(_CACHE_PATH.read_bytes())
+                self._build_name_index()
+                return
+            except Exception:
+                pass  # stale or corrupt cache; fall through to a full parse
+
+        import yaml  # deferred: only needed for this one-time load
+
+        try:  # libyaml's C loader is several times faster when available
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+
+        def _parse(path: Path):
+            # A binary stream lets the C reader consume bytes directly, and
+            # libyaml releases the GIL so files parse in parallel. load_all
+            # streams the file document by document, so authors can split
+            # data across ---separated documents without buffering the whole
+            # file as one tree.
+            with path.open("rb") as f:
+                return list(yaml.load_all(f, Loader=SafeLoader))
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+            parsed = list(pool.map(_parse, paths))
+        # Registry inserts stay on this thread; only parsing is fanned out.
+        for docs in parsed:
+            for data in docs:
+                if isinstance(data, list):
+                    for item_data in data:
+                        item = Item.from_dict(item_data)
+                        self._items[item.item_id] = item
+                elif isinstance(data, dict) and "items" in data:
+                    for item_data in data["items"]:
+                        item = Item.from_dict(item_data)
+                        self._items[item.item_id] = item
+        self._build_name_index()
+        try:
+            _CACHE_PATH.write_bytes(pickle.dumps(self._items, protocol=5))
+        except OSError:
+            pass  # read-only install; next launch just re-parses
+
+    def _build_name_index(self) -> None:
+        self._by_lower_name = {item.name_lower: item for item in self._items.values()}
+
+    def load_json(self, path: Path) -> None:
+        """Load items from a prebuilt JSON bundle (a list of item dicts).
+
+        JSON parses an order of magnitude faster than YAML, so builds can
+        ship an exported bundle while YAML stays the author-time format.
+        Uses orjson's C decoder when available, like the save system.
+        """
+        try:
+            import orjson
+
+            data = orjson.loads(path.read_bytes())
+        except ImportError:
+            import json
+
+            data = json.loads(path.read_text())
+        for item_data in data:
+            item = Item.from_dict(item_data)
+            self._items[item.item_id] = item
+        self._build_name_index()
+        self._loaded = True
 
     def get(self, item_id: str) -> Item | None:
         return self._items.get(item_id)
@@ -75,8 +173,11 @@ class ItemRegistry:
     def find_by_name(self, name: str) -> Item | None:
         """Find an item by partial name match (case-insensitive)."""
         name_lower = name.lower()
-        for item in self._items.values():
-            if name_lower in item.name.lower():
+        exact = self._by_lower_name.get(name_lower)
+        if exact is not None:
+            return exact
+        for low, item in self._by_lower_name.items():
+            if name_lower in low:
                 return item
         return None
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 from archadium.engine.state import GameState
 from archadium.entities.items import Item, ItemRegistry
 
@@ -12,6 +14,37 @@ class Player:
     def __init__(self, state: GameState, item_registry: ItemRegistry) -> None:
         self.state = state
         self.registry = item_registry
+        # Per-type index over the inventory so "all consumables" is a dict
+        # lookup instead of a registry-resolving scan.
+        self._inv_by_type: dict[str, list[str]] = {}
+        for item_id in state.inventory:
+            self._index_item(item_id)
+        # Token -> item id index for name matching, rebuilt lazily when the
+        # inventory changes rather than on every command.
+        self._token_index: dict[str, str] = {}
+        self._token_index_dirty = True
+        # Resolved references to the equipped items, kept in step by
+        # equip/unequip so stat reads never hit the registry. Base attack
+        # and defense stay live on GameState so level-ups need no
+        # invalidation here.
+        self._weapon: Item | None = (
+            item_registry.get(state.equipped_weapon) if state.equipped_weapon else None
+        )
+        self._armor: Item | None = (
+            item_registry.get(state.equipped_armor) if state.equipped_armor else None
+        )
+
+    def _index_item(self, item_id: str) -> None:
+        item = self.registry.get(item_id)
+        if item:
+            self._inv_by_type.setdefault(item.item_type, []).append(item_id)
+
+    def _deindex_item(self, item_id: str) -> None:
+        item = self.registry.get(item_id)
+        if item:
+            ids = self._inv_by_type.get(item.item_type)
+            if ids and item_id in ids:
+                ids.remove(item_id)
 
     @property
     def name(self) -> str:
@@ -27,48 +60,70 @@ class Player:
 
     @property
     def effective_attack(self) -> int:
-        bonus = 0
-        if self.state.equipped_weapon:
-            weapon = self.registry.get(self.state.equipped_weapon)
-            if weapon:
-                bonus = weapon.attack_bonus
-        return self.state.attack + bonus
+        return self.state.attack + (self._weapon.attack_bonus if self._weapon else 0)
 
     @property
     def effective_defense(self) -> int:
-        bonus = 0
-        if self.state.equipped_armor:
-            armor = self.registry.get(self.state.equipped_armor)
-            if armor:
-                bonus = armor.defense_bonus
-        return self.state.defense + bonus
+        return self.state.defense + (self._armor.defense_bonus if self._armor else 0)
 
     @property
     def weapon_name(self) -> str:
-        if self.state.equipped_weapon:
-            weapon = self.registry.get(self.state.equipped_weapon)
-            if weapon:
-                return weapon.name
-        return "Fists"
+        return self._weapon.name if self._weapon else "Fists"
 
     def add_item(self, item_id: str) -> Item | None:
         """Add an item to inventory. Returns the Item or None if not found."""
         item = self.registry.get(item_id)
         if item is None:
             return None
-        self.state.inventory.append(item_id)
+        # Stored keys are interned so later membership checks compare by
+        # pointer against the interned registry ids.
+        item_id = sys.intern(item_id)
+        inv = self.state.inventory
+        inv[item_id] = inv.get(item_id, 0) + 1
+        if inv[item_id] == 1:
+            self._index_item(item_id)
+        self._token_index_dirty = True
         return item
 
     def remove_item(self, item_id: str) -> bool:
         """Remove one instance of an item from inventory."""
-        if item_id in self.state.inventory:
-            self.state.inventory.remove(item_id)
-            return True
-        return False
+        inv = self.state.inventory
+        count = inv.get(item_id, 0)
+        if count == 0:
+            return False
+        if count == 1:
+            del inv[item_id]
+            self._deindex_item(item_id)
+            self._token_index_dirty = True
+        else:
+            inv[item_id] = count - 1
+        return True
 
     def has_item(self, item_id: str) -> bool:
         return item_id in self.state.inventory
 
+    def items_of_type(self, item_type: str) -> list[str]:
+        """Item ids of the given type currently in the inventory."""
+        return self._inv_by_type.get(item_type, [])
+
+    def find_item(self, token: str) -> str | None:
+        """Resolve an inventory item id from a player-typed name token."""
+        if self._token_index_dirty:
+            self._rebuild_token_index()
+        return self._token_index.get(token)
+
+    def _rebuild_token_index(self) -> None:
+        index: dict[str, str] = {}
+        for item_id in self.state.inventory:
+            item = self.registry.get(item_id)
+            if item is None:
+                continue
+            for token in item.name_lower.split():
+                index[token] = item_id
+            index[item.name_lower] = item_id
+        self._token_index = index
+        self._token_index_dirty = False
+
     def equip(self, item_id: str) -> str | None:
         """Equip an item. Returns an error message or None on success."""
         if item_id not in self.state.inventory:
@@ -78,9 +133,11 @@ class Player:
             return "Unknown item."
         if item.item_type == "weapon":
             self.state.equipped_weapon = item_id
+            self._weapon = item
             return None
         elif item.item_type == "armor":
             self.state.equipped_armor = item_id
+            self._armor = item
             return None
         return f"{item.name} can't be equipped."
 
@@ -90,11 +147,13 @@ class Player:
             if self.state.equipped_weapon is None:
                 return "Nothing equipped in weapon slot."
             self.state.equipped_weapon = None
+            self._weapon = None
             return None
         elif slot == "armor":
             if self.state.equipped_armor is None:
                 return "Nothing equipped in armor slot."
             self.state.equipped_armor = None
+            self._armor = None
             return None
         return "Unknown slot. Use 'weapon' or 'armor'."
 
@@ -107,7 +166,7 @@ class Player:
             return "Unknown item."
         if item.item_type != "consumable":
             return f"{item.name} can't be used that way."
-        self.state.inventory.remove(item_id)
+        self.remove_item(item_id)
         if item.heal_amount > 0:
             healed = self.state.heal(item.heal_amount)
             return f"You use {item.name} and recover {healed} HP!"
@@ -115,12 +174,8 @@ class Player:
 
     def inventory_display(self) -> list[dict]:
         """Build inventory data for display, grouping stackable items."""
-        counts: dict[str, int] = {}
-        for item_id in self.state.inventory:
-            counts[item_id] = counts.get(item_id, 0) + 1
-
         result = []
-        for item_id, qty in counts.items():
+        for item_id, qty in self.state.inventory.items():
             item = self.registry.get(item_id)
             if item:
                 entry = item.to_display_dict(qty)
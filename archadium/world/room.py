@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Exit:
     """A connection from one room to another."""
 
@@ -17,43 +18,64 @@ class Exit:
     lock_message: str = "The way is blocked."
 
     def is_accessible(self, flags: dict[str, bool]) -> bool:
-        if not self.locked:
-            return True
-        if self.required_flag and flags.get(self.required_flag, False):
-            return True
-        return False
+        # Single short-circuit expression: straight-line bytecode with fewer
+        # jumps than the equivalent if-chain, and this runs per move attempt.
+        return not self.locked or (
+            self.required_flag is not None and flags.get(self.required_flag, False)
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     """A single room/location in the game world."""
 
     room_id: str
     name: str
     description: str
-    exits: list[Exit] = field(default_factory=list)
+    exits: dict[str, Exit] = field(default_factory=dict)  # keyed by direction
     items: list[str] = field(default_factory=list)
     enemies: list[str] = field(default_factory=list)
     npcs: list[str] = field(default_factory=list)
     ascii_art: str | None = None
     on_enter_flag: str | None = None
     ambient: str = ""
+    _item_token_index: dict[str, str] = field(init=False, repr=False, compare=False)
+    _alive_cache: list[str] | None = field(
+        init=False, repr=False, compare=False, default=None
+    )
+
+    def __post_init__(self) -> None:
+        # Lookup indexes alongside the ordered item list: the list keeps
+        # display order, the dict makes find_item O(1) instead of a scan.
+        self._item_token_index = {}
+        for item_id in self.items:
+            self._index_item(item_id)
+
+    def _index_item(self, item_id: str) -> None:
+        for token in item_id.split("_"):
+            self._item_token_index[token] = item_id
+        self._item_token_index[item_id.replace("_", " ")] = item_id
 
     @classmethod
     def from_dict(cls, data: dict) -> Room:
-        exits = [
-            Exit(
-                direction=e["direction"],
-                target_room=e["target"],
+        # Ids, directions and flag names are interned: they are short strings
+        # hit by dict lookups every player step, and interning makes those
+        # compares pointer-equality fast paths.
+        intern = sys.intern
+        exits = {}
+        for e in data.get("exits", []):
+            direction = intern(e["direction"])
+            flag = e.get("required_flag")
+            exits[direction] = Exit(
+                direction=direction,
+                target_room=intern(e["target"]),
                 description=e.get("description", ""),
                 locked=e.get("locked", False),
-                required_flag=e.get("required_flag"),
+                required_flag=intern(flag) if flag else None,
                 lock_message=e.get("lock_message", "The way is blocked."),
             )
-            for e in data.get("exits", [])
-        ]
         return cls(
-            room_id=data["id"],
+            room_id=intern(data["id"]),
             name=data["name"],
             description=data["description"],
             exits=exits,
@@ -66,10 +88,37 @@ class Room:
         )
 
     def get_exit(self, direction: str) -> Exit | None:
-        for ex in self.exits:
-            if ex.direction == direction:
-                return ex
-        return None
+        return self.exits.get(direction)
+
+    def add_item(self, item_id: str) -> None:
+        """Add an item to the room, keeping the token index in sync."""
+        self.items.append(item_id)
+        self._index_item(item_id)
+
+    def remove_item(self, item_id: str) -> None:
+        """Remove an item from the room, keeping the token index in sync."""
+        self.items.remove(item_id)
+        # Tokens can be shared between items, so rebuild from what remains.
+        self._item_token_index.clear()
+        for iid in self.items:
+            self._index_item(iid)
+
+    def find_item(self, token: str) -> str | None:
+        """Resolve an item id from a player-typed token, if indexed."""
+        return self._item_token_index.get(token)
+
+    def alive_enemies(self, defeated: set[str]) -> list[str]:
+        """Return the ids of enemies in this room not yet defeated.
+
+        The result is cached until invalidate_alive_cache is called (after a
+        battle, or when a different save is loaded).
+        """
+        if self._alive_cache is None:
+            self._alive_cache = [eid for eid in self.enemies if eid not in defeated]
+        return self._alive_cache
+
+    def invalidate_alive_cache(self) -> None:
+        self._alive_cache = None
 
     def exit_directions(self) -> list[str]:
-        return [ex.direction for ex in self.exits]
+        return list(self.exits)
@@ -4,37 +4,85 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import yaml
-
 from archadium.world.room import Room
 
 DATA_DIR = Path(__file__).parent.parent / "data" / "rooms"
 
+# Warm-start cache of the parsed world: pickle.load is orders of magnitude
+# faster than re-parsing YAML, and the mtime check keeps it honest.
+_CACHE_PATH = DATA_DIR.parent / "rooms.pkl"
+
 
 class WorldMap:
     """Registry of all rooms in the game, loaded from YAML files."""
 
     def __init__(self) -> None:
         self._rooms: dict[str, Room] = {}
+        self._loaded = False
 
-    def load(self) -> None:
-        """Load all room YAML files from the data directory."""
+    def load(self, *, force: bool = False) -> None:
+        """Load all room YAML files from the data directory.
+
+        Idempotent: repeat calls are no-ops unless force=True, which
+        re-reads the data files (hot-reload tooling).
+        """
+        if self._loaded and not force:
+            return
+        self._loaded = True
         if not DATA_DIR.exists():
             return
-        for path in sorted(DATA_DIR.glob("*.yaml")):
-            data = yaml.safe_load(path.read_text())
-            if isinstance(data, list):
-                for room_data in data:
-                    room = Room.from_dict(room_data)
-                    self._rooms[room.room_id] = room
-            elif isinstance(data, dict):
-                if "rooms" in data:
-                    for room_data in data["rooms"]:
-                        room = Room.from_dict(room_data)
-                        self._rooms[room.room_id] = room
-                else:
-                    room = Room.from_dict(data)
-                    self._rooms[room.room_id] = room
+        paths = sorted(DATA_DIR.glob("*.yaml"))
+        if not paths:
+            return
+
+        import pickle
+
+        src_mtime = max(p.stat().st_mtime for p in paths)
+        if _CACHE_PATH.exists() and _CACHE_PATH.stat().st_mtime >= src_mtime:
+            try:
+                self._rooms = pickle.loads(_CACHE_PATH.read_bytes())
+                return
+            except Exception:
+                pass  # stale or corrupt cache; fall through to a full parse
+
+        import yaml  # deferred: only needed for this one-time load
+
+        try:  # libyaml's C loader is several times faster when available
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+
+        def _parse(path: Path):
+            # A binary stream lets the C reader consume bytes directly, and
+            # libyaml releases the GIL so files parse in parallel. load_all
+            # streams the file document by document, so authors can split
+            # data across ---separated documents without buffering the whole
+            # file as one tree.
+            with path.open("rb") as f:
+                return list(yaml.load_all(f, Loader=SafeLoader))
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+            parsed = list(pool.map(_parse, paths))
+        # Room inserts stay on this thread; only parsing is fanned out.
+        # Each document normalizes to an iterable of room dicts (list of
+        # rooms, {"rooms": [...]}, or one bare room); building the full list
+        # first lets one C-level dict.update do the inserts instead of a
+        # Python-level store per room. Empty documents (a trailing ---)
+        # parse as None and are skipped.
+        rooms = [
+            Room.from_dict(room_data)
+            for docs in parsed
+            for data in docs
+            if data is not None
+            for room_data in (data if isinstance(data, list) else data.get("rooms", (data,)))
+        ]
+        self._rooms.update((room.room_id, room) for room in rooms)
+        try:
+            _CACHE_PATH.write_bytes(pickle.dumps(self._rooms, protocol=5))
+        except OSError:
+            pass  # read-only install; next launch just re-parses
 
     def get_room(self, room_id: str) -> Room | None:
         return self._rooms.get(room_id)
@@ -42,6 +90,11 @@ class WorldMap:
     def all_rooms(self) -> list[Room]:
         return list(self._rooms.values())
 
+    def invalidate_alive_caches(self) -> None:
+        """Drop every room's cached alive-enemy list (after combat or a load)."""
+        for room in self._rooms.values():
+            room.invalidate_alive_cache()
+
     @property
     def room_count(self) -> int:
         return len(self._rooms)